@@ -16,36 +16,133 @@ A robust, flexible argument parsing system that handles:
 """
 
 import argparse
+import copy
+import importlib.util
 import json
 import os
 import re
 import sys
 import unicodedata
 import warnings
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-# Try to import Unicode elimination libraries
-try:
-    import unidecode
+# Unicode elimination libraries are only probed for at import time (find_spec
+# does not execute them); _ensure_unicode_libs() imports them on first use,
+# keeping them out of CLI startup time
+unidecode = None
+emoji = None
+ftfy = None
+UNIDECODE_AVAILABLE = importlib.util.find_spec("unidecode") is not None
+EMOJI_AVAILABLE = importlib.util.find_spec("emoji") is not None
+FTFY_AVAILABLE = importlib.util.find_spec("ftfy") is not None
+_unicode_libs_loaded = False
+
+
+def _ensure_unicode_libs():
+    """
+    Import the available Unicode elimination libraries (once).
+    A library that was found but fails to import is marked unavailable.
+    """
+    global unidecode, emoji, ftfy
+    global UNIDECODE_AVAILABLE, EMOJI_AVAILABLE, FTFY_AVAILABLE
+    global _unicode_libs_loaded
+
+    if _unicode_libs_loaded:
+        return
+    _unicode_libs_loaded = True
+
+    if UNIDECODE_AVAILABLE:
+        try:
+            import unidecode
+        except ImportError:
+            UNIDECODE_AVAILABLE = False
+
+    if EMOJI_AVAILABLE:
+        try:
+            import emoji
+        except ImportError:
+            EMOJI_AVAILABLE = False
+
+    if FTFY_AVAILABLE:
+        try:
+            import ftfy
+        except ImportError:
+            FTFY_AVAILABLE = False
 
-    UNIDECODE_AVAILABLE = True
-except ImportError:
-    UNIDECODE_AVAILABLE = False
 
 try:
-    import emoji
+    import yaml
 
-    EMOJI_AVAILABLE = True
+    YAML_AVAILABLE = True
 except ImportError:
-    EMOJI_AVAILABLE = False
+    YAML_AVAILABLE = False
 
 try:
-    import ftfy
+    import orjson
 
-    FTFY_AVAILABLE = True
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads
 except ImportError:
-    FTFY_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+    _json_loads = json.loads
+
+# Errors that mean "this config file is unusable" (decode errors from json,
+# orjson and UTF-8 are all ValueError; non-mapping content is TypeError)
+_CONFIG_ERRORS = (OSError, ValueError, TypeError)
+if YAML_AVAILABLE:
+    _CONFIG_ERRORS += (yaml.YAMLError,)
+
+
+# Compiled regex patterns, built once at import time
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001f600-\U0001f64f"  # emoticons
+    "\U0001f300-\U0001f5ff"  # symbols & pictographs
+    "\U0001f680-\U0001f6ff"  # transport & map symbols
+    "\U0001f1e0-\U0001f1ff"  # flags (iOS)
+    "\U00002700-\U000027bf"  # dingbats
+    "\U0001f926-\U0001f937"  # gestures
+    "\U00010000-\U0010ffff"  # other unicode
+    "\u2640-\u2642"  # gender symbols
+    "\u2600-\u2b55"  # misc symbols
+    "\u200d"  # zero width joiner
+    "\u23cf"  # eject symbol
+    "\u23e9"  # fast forward
+    "\u231a"  # watch
+    "\ufe0f"  # variation selector
+    "\u3030"  # wavy dash
+    "]+",
+    flags=re.UNICODE,
+)
+_FN_BAD_RE = re.compile(r'[<>:"/\\|?*]')
+_FN_NONALNUM_RE = re.compile(r"[^a-zA-Z0-9._-]")
+_FN_UNDERSCORES_RE = re.compile(r"_+")
+
+# Name keywords used for type inference, searched in priority order
+_INT_HINT_RE = re.compile("count|number|size|port|timeout")
+_FLOAT_HINT_RE = re.compile("rate|factor|ratio")
+_BOOL_HINT_RE = re.compile("enable|disable|verbose|quiet|debug")
+_REQUIRED_RE = re.compile(
+    "input|file|source|target|destination|host|server|database|username|password"
+)
+
+
+def _collapse_whitespace(text: str) -> str:
+    """
+    Collapse whitespace runs to single spaces and strip the ends.
+
+    str.split() uses the same whitespace definition as the regex ``\\s``
+    class, but scans and joins in C with no regex engine overhead.
+    """
+    return " ".join(text.split())
+
+
+def _is_clean_ascii(text: str) -> bool:
+    """True if text is ASCII with no whitespace left to collapse or strip."""
+    return text.isascii() and text == _collapse_whitespace(text)
 
 
 class UnicodeEliminator:
@@ -65,27 +162,8 @@ class UnicodeEliminator:
         self.aggressive = aggressive
         self.ascii_only = ascii_only
 
-        # Compile regex patterns for maximum efficiency
-        self.emoji_pattern = re.compile(
-            "["
-            "\U0001f600-\U0001f64f"  # emoticons
-            "\U0001f300-\U0001f5ff"  # symbols & pictographs
-            "\U0001f680-\U0001f6ff"  # transport & map symbols
-            "\U0001f1e0-\U0001f1ff"  # flags (iOS)
-            "\U00002700-\U000027bf"  # dingbats
-            "\U0001f926-\U0001f937"  # gestures
-            "\U00010000-\U0010ffff"  # other unicode
-            "\u2640-\u2642"  # gender symbols
-            "\u2600-\u2b55"  # misc symbols
-            "\u200d"  # zero width joiner
-            "\u23cf"  # eject symbol
-            "\u23e9"  # fast forward
-            "\u231a"  # watch
-            "\ufe0f"  # variation selector
-            "\u3030"  # wavy dash
-            "]+",
-            flags=re.UNICODE,
-        )
+        # Share the module-level compiled pattern across instances
+        self.emoji_pattern = _EMOJI_RE
 
     def eliminate_unicode(self, text: Union[str, Any]) -> Union[str, Any]:
         """
@@ -94,6 +172,14 @@ class UnicodeEliminator:
         if not isinstance(text, str):
             return text
 
+        # Fast path: pure ASCII has no emoji or decomposable characters.
+        # Not taken with ftfy, which also changes ASCII (HTML entities,
+        # terminal escapes and other control characters)
+        if not FTFY_AVAILABLE and text.isascii():
+            return _collapse_whitespace(text)
+
+        _ensure_unicode_libs()
+
         # Step 1: Fix common encoding issues
         if FTFY_AVAILABLE:
             text = ftfy.fix_text(text)
@@ -115,7 +201,7 @@ class UnicodeEliminator:
             )
 
         # Step 4: Clean up extra whitespace
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _collapse_whitespace(text)
 
         return text
 
@@ -124,9 +210,9 @@ class UnicodeEliminator:
         Sanitize filename by removing Unicode and special characters
         """
         clean_name = self.eliminate_unicode(filename)
-        clean_name = re.sub(r'[<>:"/\\|?*]', "", clean_name)
-        clean_name = re.sub(r"[^a-zA-Z0-9._-]", "_", clean_name)
-        clean_name = re.sub(r"_+", "_", clean_name).strip("_")
+        clean_name = _FN_BAD_RE.sub("", clean_name)
+        clean_name = _FN_NONALNUM_RE.sub("_", clean_name)
+        clean_name = _FN_UNDERSCORES_RE.sub("_", clean_name).strip("_")
         return clean_name or "file"
 
 
@@ -134,12 +220,20 @@ class UnicodeEliminator:
 _unicode_eliminator = UnicodeEliminator(aggressive=True, ascii_only=True)
 
 
+@lru_cache(maxsize=1024)
+def _eliminate_unicode_cached(text: str) -> str:
+    """Memoized elimination for repeated argv tokens and defaults."""
+    return _unicode_eliminator.eliminate_unicode(text)
+
+
 def eliminate_unicode_maximum(text: Union[str, Any]) -> Union[str, Any]:
     """
     Maximum Unicode elimination function - use this everywhere!
     Eliminates all emoji and Unicode bullshit from arguments and text
     """
-    return _unicode_eliminator.eliminate_unicode(text)
+    if isinstance(text, str):
+        return _eliminate_unicode_cached(text)
+    return text
 
 
 def sanitize_filename_maximum(filename: str) -> str:
@@ -149,6 +243,47 @@ def sanitize_filename_maximum(filename: str) -> str:
     return _unicode_eliminator.sanitize_filename(filename)
 
 
+@lru_cache(maxsize=512)
+def _env_suffix(name: str) -> str:
+    """Environment variable suffix for a normalized --name."""
+    return name[2:].upper().replace("-", "_")
+
+
+@lru_cache(maxsize=512)
+def _attr_name(name: str) -> str:
+    """Namespace attribute name for a normalized --name."""
+    return name[2:].replace("-", "_")
+
+
+def _trigrams(text: str) -> set:
+    """Padded character trigrams used for fuzzy argument suggestions."""
+    padded = f"  {text.lower()}  "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+# Suggestion tuning: minimum trigram Jaccard similarity, and the largest
+# candidate set for which an empty result falls back to difflib
+_SUGGEST_CUTOFF = 0.3
+_DIFFLIB_FALLBACK_LIMIT = 100
+
+
+# Enhancement parameters that argparse doesn't understand
+_CUSTOM_PARAMS = frozenset({"env_var", "config_key", "validator"})
+
+
+@dataclass
+class _ArgSpec:
+    """Per-argument metadata derived once at add_argument time."""
+
+    attr_name: str
+    argparse_kwargs: Dict[str, Any]
+    env_var: Optional[str]
+    config_key: Optional[str]
+    validator: Optional[Callable]
+    expected_type: Optional[type]
+    default: Any
+
+
 class ArgumentParser:
     """
     Advanced argument parser that fixes all the common arg parsing problems.
@@ -161,12 +296,29 @@ class ArgumentParser:
         description: str = None,
         unicode_safe: bool = True,
     ):
+        # The argv[0] fallback is only evaluated when program_name is not given
         self.program_name = program_name or Path(sys.argv[0]).stem
         self.description = description or f"{self.program_name} - Advanced CLI Tool"
         self.args_definitions = {}
+        self._arg_specs: Dict[str, _ArgSpec] = {}
+        # Trigram -> argument names (without --), for typo suggestions
+        self._trigram_index: Dict[str, List[str]] = {}
+        self._trigram_sizes: Dict[str, int] = {}
+        # Env var name -> argument names, plus the last converted env lookup
+        self._env_var_args: Dict[str, List[str]] = {}
+        self._env_cache_key: Optional[Tuple] = None
+        self._env_cache: Dict[str, Any] = {}
         self.subcommands = {}
         self.global_args = {}
         self.config_files = []
+        # Parsed config files keyed by path, tagged with (mtime_ns, size)
+        self._config_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        self._config_signature: Optional[Tuple] = None
+        self._merged_config: Dict[str, Any] = {}
+        # Underlying argparse parser, rebuilt only after definitions change
+        self._cached_parser: Optional[argparse.ArgumentParser] = None
+        self._cached_actions: Dict[str, argparse.Action] = {}
+        self._dirty = True
         self.env_prefix = self.program_name.upper().replace("-", "_")
         self.unicode_safe = unicode_safe  # Enable Unicode elimination
 
@@ -206,12 +358,52 @@ class ArgumentParser:
 
         # Store env var mapping
         if "env_var" not in kwargs:
-            kwargs["env_var"] = (
-                f"{self.env_prefix}_{name[2:].upper().replace('-', '_')}"
-            )
+            kwargs["env_var"] = f"{self.env_prefix}_{_env_suffix(name)}"
+
+        # argparse-ready kwargs: drop custom params, resolve boolean flags
+        argparse_kwargs = {
+            k: v
+            for k, v in kwargs.items()
+            if k not in _CUSTOM_PARAMS and k != "default"
+        }
+        if argparse_kwargs.get("type") == bool:
+            # Boolean flags take no value, so argparse must not see type=bool
+            # (it rejects it alongside store_true/store_false); the expected
+            # type is kept on the spec for env parsing and validation
+            argparse_kwargs.pop("type")
+            if not argparse_kwargs.get("action"):
+                argparse_kwargs["action"] = "store_true"
 
         self.args_definitions[name] = kwargs
 
+        # Index name trigrams for suggestions
+        clean_name = name[2:]
+        if clean_name not in self._trigram_sizes:
+            grams = _trigrams(clean_name)
+            for gram in grams:
+                self._trigram_index.setdefault(gram, []).append(clean_name)
+            self._trigram_sizes[clean_name] = len(grams)
+
+        # Map env var back to the argument (dropping any previous mapping)
+        previous = self._arg_specs.get(name)
+        if previous is not None and previous.env_var in self._env_var_args:
+            self._env_var_args[previous.env_var].remove(name)
+        env_var = kwargs.get("env_var")
+        if env_var:
+            self._env_var_args.setdefault(env_var, []).append(name)
+        self._env_cache_key = None
+
+        self._arg_specs[name] = _ArgSpec(
+            attr_name=_attr_name(name),
+            argparse_kwargs=argparse_kwargs,
+            env_var=kwargs.get("env_var"),
+            config_key=kwargs.get("config_key"),
+            validator=kwargs.get("validator"),
+            expected_type=kwargs.get("type"),
+            default=kwargs.get("default"),
+        )
+        self._dirty = True
+
     def add_subcommand(self, name: str, parser_func: Callable, help_text: str = None):
         """
         Add a subcommand with its own parser function.
@@ -225,14 +417,18 @@ class ArgumentParser:
             "func": parser_func,
             "help": help_text or f"Run {name} subcommand",
         }
+        self._dirty = True
 
     def add_config_file(self, path: Union[str, Path]):
         """Add a config file to load defaults from."""
         self.config_files.append(Path(path))
+        self._dirty = True
 
     def set_env_prefix(self, prefix: str):
         """Set environment variable prefix."""
         self.env_prefix = prefix
+        self._env_cache_key = None
+        self._dirty = True
 
     def _infer_type(self, name: str, default_value) -> type:
         """Infer argument type from name and default."""
@@ -241,23 +437,13 @@ class ArgumentParser:
 
         name_lower = name.lower()
 
-        # Type inference from name patterns
-        if any(
-            word in name_lower
-            for word in ["count", "number", "size", "port", "timeout"]
-        ):
+        # Type inference from name patterns (file/path/dir/... fall back to str)
+        if _INT_HINT_RE.search(name_lower):
             return int
-        elif any(word in name_lower for word in ["rate", "factor", "ratio"]):
+        elif _FLOAT_HINT_RE.search(name_lower):
             return float
-        elif any(
-            word in name_lower
-            for word in ["enable", "disable", "verbose", "quiet", "debug"]
-        ):
+        elif _BOOL_HINT_RE.search(name_lower):
             return bool
-        elif any(
-            word in name_lower for word in ["file", "path", "dir", "output", "input"]
-        ):
-            return str
         else:
             return str
 
@@ -268,19 +454,7 @@ class ArgumentParser:
 
     def _is_required_arg(self, name: str) -> bool:
         """Determine if an argument should be required."""
-        required_patterns = [
-            "input",
-            "file",
-            "source",
-            "target",
-            "destination",
-            "host",
-            "server",
-            "database",
-            "username",
-            "password",
-        ]
-        return any(pattern in name.lower() for pattern in required_patterns)
+        return _REQUIRED_RE.search(name.lower()) is not None
 
     def _generate_help_text(self, name: str, kwargs: dict) -> str:
         """Generate helpful help text."""
@@ -302,40 +476,76 @@ class ArgumentParser:
             return help_text
 
     def _load_config_defaults(self) -> Dict[str, Any]:
-        """Load defaults from config files."""
-        defaults = {}
-
+        """Load defaults from config files, reusing unchanged parses."""
+        stamps = []
         for config_file in self.config_files:
-            if config_file.exists():
-                try:
-                    if config_file.suffix == ".json":
-                        with open(config_file, "r") as f:
-                            config = json.load(f)
-                            defaults.update(config)
-                    elif config_file.suffix in [".yaml", ".yml"]:
-                        try:
-                            import yaml
-
-                            with open(config_file, "r") as f:
-                                config = yaml.safe_load(f)
-                                defaults.update(config)
-                        except ImportError:
-                            pass  # YAML not available
-                except Exception:
-                    pass  # Config file error, skip
+            try:
+                st = config_file.stat()
+                stamps.append((config_file, (st.st_mtime_ns, st.st_size)))
+            except OSError:
+                stamps.append((config_file, None))  # Missing file, skip
+        signature = tuple(stamps)
+
+        # Nothing changed since the last call. Values end up in the parsed
+        # Namespace, so hand out a copy that callers may mutate freely
+        if signature == self._config_signature:
+            return copy.deepcopy(self._merged_config)
 
-        return defaults
+        defaults = {}
+        for config_file, stamp in signature:
+            if stamp is None:
+                continue
+            cached = self._config_cache.get(config_file)
+            if cached is None or cached[0] != stamp:
+                cached = (stamp, self._read_config_file(config_file))
+                self._config_cache[config_file] = cached
+            defaults.update(cached[1])
+
+        self._config_signature = signature
+        self._merged_config = defaults
+        return copy.deepcopy(defaults)
+
+    def _read_config_file(self, config_file: Path) -> Dict[str, Any]:
+        """Parse a single JSON/YAML config file."""
+        try:
+            if config_file.suffix == ".json":
+                # Binary read: orjson only accepts bytes (json.loads takes both)
+                with open(config_file, "rb") as f:
+                    return dict(_json_loads(f.read()))
+            elif config_file.suffix in [".yaml", ".yml"] and YAML_AVAILABLE:
+                with open(config_file, "r") as f:
+                    # An empty YAML document loads as None
+                    return dict(yaml.safe_load(f) or {})
+        except _CONFIG_ERRORS as e:
+            # Config file error, skip
+            warnings.warn(f"Skipping config file {config_file}: {e}")
+
+        return {}
 
     def _load_env_defaults(self) -> Dict[str, Any]:
         """Load defaults from environment variables."""
+        # Walk whichever side is smaller: the environment or our env vars
+        environ = os.environ
+        env_var_args = self._env_var_args
+        if len(environ) < len(env_var_args):
+            matched = tuple(
+                (key, value) for key, value in environ.items() if key in env_var_args
+            )
+        else:
+            matched = tuple(
+                (key, environ[key]) for key in env_var_args if key in environ
+            )
+
+        # Same variables with the same values as last time
+        if matched == self._env_cache_key:
+            return self._env_cache
+
         defaults = {}
 
-        for arg_name, arg_config in self.args_definitions.items():
-            env_var = arg_config.get("env_var")
-            if env_var and env_var in os.environ:
+        for env_var, value in matched:
+            for arg_name in env_var_args[env_var]:
                 try:
-                    value = os.environ[env_var]
-                    arg_type = arg_config.get("type", str)
+                    arg_type = self._arg_specs[arg_name].expected_type or str
 
                     # Type conversion
                     if arg_type == bool:
@@ -349,8 +559,38 @@ class ArgumentParser:
                 except ValueError:
                     pass  # Invalid env var value, skip
 
+        self._env_cache_key = matched
+        self._env_cache = defaults
         return defaults
 
+    def _build_parser(self) -> argparse.ArgumentParser:
+        """Build the underlying argparse parser from the current definitions."""
+        parser = argparse.ArgumentParser(
+            prog=self.program_name,
+            description=self.description,
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+        )
+
+        # Add subcommands if any
+        if self.subcommands:
+            subparsers = parser.add_subparsers(
+                dest="subcommand", help="Available subcommands"
+            )
+
+            for sub_name, sub_config in self.subcommands.items():
+                subparser = subparsers.add_parser(sub_name, help=sub_config["help"])
+                # Call subcommand parser function
+                sub_config["func"](subparser)
+
+        # Add arguments, keeping each Action so defaults can be injected per parse
+        self._cached_actions = {}
+        for arg_name, spec in self._arg_specs.items():
+            self._cached_actions[arg_name] = parser.add_argument(
+                arg_name, default=spec.default, **spec.argparse_kwargs
+            )
+
+        return parser
+
     def parse_args(self, args: List[str] = None) -> argparse.Namespace:
         """
         Parse arguments with all the fixes applied.
@@ -365,67 +605,57 @@ class ArgumentParser:
         if args is None:
             args = sys.argv[1:]
 
-        # Apply Unicode elimination to all arguments if enabled
-        if self.unicode_safe:
+        # Apply Unicode elimination to all arguments if enabled (skipped
+        # entirely when every token would come back unchanged, the common case)
+        argv_sanitized = False
+        if self.unicode_safe and (
+            FTFY_AVAILABLE
+            or any(isinstance(arg, str) and not _is_clean_ascii(arg) for arg in args)
+        ):
             args = [
                 eliminate_unicode_maximum(arg) if isinstance(arg, str) else arg
                 for arg in args
             ]
+            argv_sanitized = True
 
-        # Create parser
-        parser = argparse.ArgumentParser(
-            prog=self.program_name,
-            description=self.description,
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-        )
-
-        # Add subcommands if any
-        if self.subcommands:
-            subparsers = parser.add_subparsers(
-                dest="subcommand", help="Available subcommands"
-            )
-
-            for sub_name, sub_config in self.subcommands.items():
-                subparser = subparsers.add_parser(sub_name, help=sub_config["help"])
-                # Call subcommand parser function
-                sub_config["func"](subparser)
+        # Reuse the parser unless definitions changed since the last build
+        if self._dirty or self._cached_parser is None:
+            self._cached_parser = self._build_parser()
+            self._dirty = False
+        parser = self._cached_parser
 
         # Load defaults from config and env
         config_defaults = self._load_config_defaults()
         env_defaults = self._load_env_defaults()
 
-        # Add arguments
-        for arg_name, arg_config in self.args_definitions.items():
-            # Merge defaults (config -> env -> defined default)
-            default_value = arg_config.get("default")
+        # Merge defaults (config -> env -> defined default)
+        merged_defaults = {}
+        for arg_name, spec in self._arg_specs.items():
+            default_value = spec.default
             if arg_name in config_defaults:
                 default_value = config_defaults[arg_name]
             if arg_name in env_defaults:
                 default_value = env_defaults[arg_name]
-
-            # Create argument config (filter out custom parameters)
-            arg_kwargs = arg_config.copy()
-            arg_kwargs["default"] = default_value
-
-            # Remove custom parameters that argparse doesn't understand
-            custom_params = ["env_var", "config_key", "validator"]
-            for param in custom_params:
-                arg_kwargs.pop(param, None)
-
-            # Handle boolean flags
-            if arg_kwargs.get("type") == bool and not arg_kwargs.get("action"):
-                arg_kwargs["action"] = "store_true"
-                # Remove type for boolean actions
-                arg_kwargs.pop("type", None)
-
-            parser.add_argument(arg_name, **arg_kwargs)
+            merged_defaults[spec.attr_name] = default_value
+            # Set on the Action itself so a custom dest= is honoured
+            self._cached_actions[arg_name].default = default_value
+
+        # String defaults (config, env, defined) never went through the argv
+        # pass; None means nothing was sanitized upstream
+        unsanitized = None
+        if argv_sanitized:
+            unsanitized = {
+                attr
+                for attr, value in merged_defaults.items()
+                if isinstance(value, str)
+            }
 
         # Parse with error handling
         try:
             parsed_args = parser.parse_args(args)
 
             # Validate required args
-            self._validate_args(parsed_args)
+            self._validate_args(parsed_args, unsanitized)
 
             return parsed_args
 
@@ -435,34 +665,49 @@ class ArgumentParser:
                 self._suggest_corrections(args)
             raise e
 
-    def _validate_args(self, args: argparse.Namespace):
-        """Validate parsed arguments with Unicode safety."""
+    def _validate_args(
+        self, args: argparse.Namespace, unsanitized: Optional[set] = None
+    ):
+        """
+        Validate parsed arguments with Unicode safety.
+
+        Args:
+            args: Parsed namespace to validate in place
+            unsanitized: Attribute names that still need Unicode elimination
+                (default: all string values)
+        """
         errors = []
+        # Namespace stores attributes in its __dict__; work on it directly
+        namespace = vars(args)
 
-        for arg_name, arg_config in self.args_definitions.items():
-            attr_name = arg_name[2:].replace("-", "_")
-            value = getattr(args, attr_name, None)
+        for arg_name, spec in self._arg_specs.items():
+            attr_name = spec.attr_name
+            value = namespace.get(attr_name)
 
             # Apply Unicode elimination to string values if enabled
-            if self.unicode_safe and isinstance(value, str):
+            if (
+                self.unicode_safe
+                and isinstance(value, str)
+                and (unsanitized is None or attr_name in unsanitized)
+            ):
                 value = eliminate_unicode_maximum(value)
-                setattr(args, attr_name, value)
+                namespace[attr_name] = value
 
             # Type validation
-            expected_type = arg_config.get("type")
+            expected_type = spec.expected_type
             if expected_type and value is not None:
                 if not isinstance(value, expected_type):
                     try:
                         # Try conversion
                         converted = expected_type(value)
-                        setattr(args, attr_name, converted)
+                        namespace[attr_name] = converted
                     except (ValueError, TypeError):
                         errors.append(
                             f"{arg_name}: Expected {expected_type.__name__}, got {type(value).__name__}"
                         )
 
             # Custom validation
-            validator = arg_config.get("validator")
+            validator = spec.validator
             if validator and callable(validator):
                 try:
                     validator(value)
@@ -492,16 +737,34 @@ class ArgumentParser:
 
     def _find_similar_args(self, arg: str, candidates: List[str]) -> List[str]:
         """Find similar argument names using fuzzy matching."""
-        import difflib
-
         # Remove -- prefix for comparison
         arg_clean = arg[2:] if arg.startswith("--") else arg
         candidates_clean = [c[2:] if c.startswith("--") else c for c in candidates]
-
-        # Find close matches
-        matches = difflib.get_close_matches(
-            arg_clean, candidates_clean, n=3, cutoff=0.6
-        )
+        allowed = set(candidates_clean)
+
+        # Count shared trigrams via the index built in add_argument
+        query = _trigrams(arg_clean)
+        shared: Dict[str, int] = {}
+        for gram in query:
+            for name in self._trigram_index.get(gram, ()):
+                if name in allowed:
+                    shared[name] = shared.get(name, 0) + 1
+
+        # Rank by Jaccard similarity
+        scored = []
+        for name, count in shared.items():
+            score = count / (len(query) + self._trigram_sizes[name] - count)
+            if score >= _SUGGEST_CUTOFF:
+                scored.append((-score, name))
+        matches = [name for _, name in sorted(scored)[:3]]
+
+        # Short names may share too few trigrams; difflib is cheap for small sets
+        if not matches and len(candidates_clean) <= _DIFFLIB_FALLBACK_LIMIT:
+            import difflib
+
+            matches = difflib.get_close_matches(
+                arg_clean, candidates_clean, n=3, cutoff=0.6
+            )
         return [f"--{match}" for match in matches]
 
     def get_help_text(self) -> str: